@@ -1,3 +1,7 @@
+import copy
+import json
+import pickle
+
 from tilematrix import TilePyramid
 
 
@@ -24,3 +28,59 @@ def test_custom(grid_definition_proj, grid_definition_epsg):
         assert isinstance(tp_dict, dict)
         tp2 = TilePyramid.from_dict(tp_dict)
         assert tp == tp2
+
+
+def test_pickle():
+    tp = TilePyramid("geodetic", metatiling=2)
+    hash(tp)
+    tp.matrix_width(5)
+    tp2 = pickle.loads(pickle.dumps(tp))
+    # cached hash is not restored as it may differ between interpreter sessions
+    assert tp2._hash is None
+    assert tp == tp2
+    assert hash(tp) == hash(tp2)
+    assert tp.matrix_width(5) == tp2.matrix_width(5)
+
+
+def test_from_dict(grid_definition_proj):
+    tp = TilePyramid(grid_definition_proj, metatiling=2)
+    tp_dict = tp.to_dict()
+    original = copy.deepcopy(tp_dict)
+    # from_dict is a classmethod and can also be called from an instance
+    assert tp.from_dict(tp_dict) == tp
+    # input dictionary is not altered
+    assert tp_dict == original
+    # equal grid definitions are parsed only once
+    assert (
+        TilePyramid.from_dict(copy.deepcopy(tp_dict)).grid
+        is TilePyramid.from_dict(copy.deepcopy(tp_dict)).grid
+    )
+    # dictionaries dumped to and loaded from JSON contain lists instead of tuples
+    json_dict = json.loads(json.dumps(tp_dict))
+    json_original = copy.deepcopy(json_dict)
+    assert TilePyramid.from_dict(json_dict) == tp
+    assert json_dict == json_original
+    assert TilePyramid.from_dict(json_dict).grid is TilePyramid.from_dict(tp_dict).grid
+    # grid dictionaries which cannot be cached are not altered either
+    uncached_dict = copy.deepcopy(json_dict)
+    uncached_dict["grid"]["srs"] = {"wkt": uncached_dict["grid"]["srs"]["wkt"], "x": []}
+    uncached_original = copy.deepcopy(uncached_dict)
+    TilePyramid.from_dict(uncached_dict)
+    assert uncached_dict == uncached_original
+
+
+def test_from_dict_value_types():
+    # int and float bounds are equal but result in different representations
+    for number_type in [int, float, int]:
+        grid = dict(
+            shape=[1, 1],
+            bounds=[number_type(v) for v in (-4000000, -4000000, 4000000, 4000000)],
+            is_global=number_type(0),
+            srs={"epsg": 3035},
+        )
+        tp = TilePyramid.from_dict(dict(grid=copy.deepcopy(grid)))
+        expected = TilePyramid(grid)
+        assert tp == expected
+        assert repr(tp) == repr(expected)
+        assert hash(tp) == hash(expected)
+        assert {expected: True}.get(tp)
@@ -1,7 +1,8 @@
 """Tile geometries and tiles from geometries."""
 
 import pytest
-from shapely.geometry import Point, Polygon, shape
+from shapely.geometry import MultiPoint, Point, Polygon, shape
+from shapely.prepared import prep
 from types import GeneratorType
 
 from tilematrix import TilePyramid, Tile
@@ -198,6 +199,24 @@ def test_tiles_from_bbox():
     assert test_tiles == bbox_tiles
 
 
+def test_tiles_from_geom_within_tile():
+    """Geometries within one tile as well as touching tile edges."""
+    tp = TilePyramid("geodetic")
+    zoom = 5
+    tile = tp.tile(zoom, 3, 3)
+    # geometry inside of tile
+    polygon = tile.bbox().buffer(-1)
+    assert [t.id for t in tp.tiles_from_geom(polygon, zoom)] == [tile.id]
+    batches = list(tp.tiles_from_geom(polygon, zoom, batch_by="row"))
+    assert len(batches) == 1
+    assert [t.id for t in batches[0]] == [tile.id]
+    # geometry equal to tile bounding box
+    assert [t.id for t in tp.tiles_from_geom(tile.bbox(), zoom)] == [tile.id]
+    # geometry crossing tile edge
+    polygon = tile.bbox().buffer(1)
+    assert len(list(tp.tiles_from_geom(polygon, zoom))) == 9
+
+
 def test_tiles_from_empty_geom():
     """Get tiles from empty geometry."""
     test_geom = Polygon()
@@ -232,6 +251,29 @@ def test_tiles_from_multipoint(multipoint):
     assert multipoint_tiles == test_tiles
 
 
+def test_tiles_from_multipoint_on_edges():
+    """Points on tile edges also intersect with neighbor tiles."""
+    tp = TilePyramid("geodetic")
+    zoom = 5
+    tile = tp.tile(zoom, 3, 3)
+    multipoint = MultiPoint(
+        [
+            (tile.left - 10, tile.top + 10),
+            (tile.left, tile.top),
+            (tile.right + 10, tile.bottom - 10),
+        ]
+    )
+    prepared = prep(multipoint)
+    control = [
+        t.id
+        for t in tp.tiles_from_bbox(multipoint, zoom)
+        if prepared.intersects(t.bbox())
+    ]
+    assert [t.id for t in tp.tiles_from_geom(multipoint, zoom)] == control
+    # all four tiles touching the point on the tile corner are included
+    assert {(5, 2, 2), (5, 2, 3), (5, 3, 2), (5, 3, 3)}.issubset(control)
+
+
 def test_tiles_from_linestring(linestring):
     """Get tiles from LineString."""
     test_tiles = {
@@ -1,6 +1,6 @@
 import pytest
 from rasterio.crs import CRS
-from shapely.geometry import box
+from shapely.geometry import LineString, Point, box
 
 from tilematrix import clip_geometry_to_srs_bounds, TilePyramid, validate_zoom
 from tilematrix._funcs import _verify_shape_bounds, _get_crs
@@ -65,6 +65,14 @@ def test_no_clip():
     assert len(out_geom) == 1
     assert geometry == out_geom[0]
 
+    # geometries touching the TilePyramid bounds
+    for geometry in [
+        LineString([(180, 0), (180, 10)]),
+        Point(-180, 90),
+        box(170, 80, 180, 90),
+    ]:
+        assert clip_geometry_to_srs_bounds(geometry, tp) == geometry
+
 
 def test_validate_zoom():
     with pytest.raises(TypeError):
@@ -1,7 +1,9 @@
 """Tile properties."""
 
 from affine import Affine
+import gc
 import pytest
+import weakref
 
 from tilematrix import TilePyramid
 
@@ -149,6 +151,25 @@ def test_intersecting():
     assert test_tiles == intersecting_tiles
 
 
+def test_intersecting_target_pyramid():
+    tp_source = TilePyramid("geodetic", metatiling=2)
+    tp_target = TilePyramid("geodetic")
+    tile = tp_source.tile(5, 2, 2)
+    assert tile.intersecting(tp_target) == tp_target.intersecting(tile)
+    # tiles belong to the given TilePyramid, even if an equal one was used before
+    other_tp_target = TilePyramid("geodetic")
+    assert all(t.tp is other_tp_target for t in tile.intersecting(other_tp_target))
+    assert all(t.tp is tp_target for t in tile.intersecting(tp_target))
+    # target TilePyramid is not kept alive
+    target_ref = weakref.ref(other_tp_target)
+    del other_tp_target
+    gc.collect()
+    assert target_ref() is None
+    # source grids have to match
+    with pytest.raises(ValueError):
+        tile.intersecting(TilePyramid("mercator"))
+
+
 def test_tile_compare():
     tp = TilePyramid("geodetic")
     a = tp.tile(5, 5, 5)
@@ -198,3 +219,15 @@ def test_tile_sizes():
     tp = TilePyramid("geodetic")
     tile = tp.tile(5, 5, 5)
     assert tile.x_size == tile.y_size
+
+
+def test_cached_bbox():
+    tp = TilePyramid("geodetic")
+    tile = tp.tile(5, 5, 5)
+    # bounds and bounding box without pixelbuffer are reused
+    assert tile.bounds() is tile.bounds()
+    assert tile.bbox() is tile.bbox()
+    assert tile.bbox().bounds == tile.bounds()
+    # buffered bounds are not affected by the cached ones
+    assert tile.bounds(1) != tile.bounds()
+    assert tile.bbox(1).contains(tile.bbox())
@@ -4,8 +4,10 @@ import pytest
 from shapely.geometry import Point, box
 from shapely.ops import unary_union
 from types import GeneratorType
+import warnings
+import weakref
 
-from tilematrix import TilePyramid, snap_bounds
+from tilematrix import TilePyramid, TileIndex, snap_bounds
 
 
 def test_init():
@@ -99,6 +101,10 @@ def test_tilepyramid_compare(grid_definition_proj, grid_definition_epsg):
     assert TilePyramid(gproj) != TilePyramid(abounds)
     # other type
     assert TilePyramid("geodetic") != "string"
+    # equal pyramids have equal hashes
+    assert hash(TilePyramid("geodetic")) == hash(TilePyramid("geodetic"))
+    assert hash(TilePyramid(gepsg)) == hash(TilePyramid(gepsg))
+    assert hash(TilePyramid("geodetic")) != hash(TilePyramid("geodetic", metatiling=2))
 
 
 def test_grid_compare(grid_definition_proj, grid_definition_epsg):
@@ -345,6 +351,77 @@ def test_tiles_from_geom_exact(tile_bounds_polygon):
     assert tiles == 3
 
 
+def test_tile_ids_from_bounds(grid_definition_proj):
+    zoom = 5
+    for tp, bounds in [
+        (TilePyramid("geodetic"), (0, 0, 90, 90)),
+        # bounds crossing the antimeridian
+        (TilePyramid("geodetic"), (-185, 0, -175, 10)),
+        (
+            TilePyramid(grid_definition_proj),
+            tuple(TilePyramid(grid_definition_proj).bounds),
+        ),
+    ]:
+        tiles = [t.id for t in tp.tiles_from_bounds(bounds, zoom)]
+        tile_ids = list(tp.tile_ids_from_bounds(bounds, zoom))
+        assert tiles
+        assert tile_ids == tiles
+        assert all(isinstance(tile_id, TileIndex) for tile_id in tile_ids)
+        for batch_by in ["row", "column"]:
+            assert [
+                list(batch)
+                for batch in tp.tile_ids_from_bounds(bounds, zoom, batch_by=batch_by)
+            ] == [
+                [t.id for t in batch]
+                for batch in tp.tiles_from_bounds(bounds, zoom, batch_by=batch_by)
+            ]
+        assert list(tp.tile_ids_from_bbox(box(*bounds), zoom)) == tiles
+        # batches can also be consumed after all of them were created
+        for batch_by in ["row", "column"]:
+            assert (
+                [
+                    list(batch)
+                    for batch in list(
+                        tp.tile_ids_from_bounds(bounds, zoom, batch_by=batch_by)
+                    )
+                ]
+                == [
+                    [t.id for t in batch]
+                    for batch in list(
+                        tp.tiles_from_bounds(bounds, zoom, batch_by=batch_by)
+                    )
+                ]
+                == [
+                    list(batch)
+                    for batch in tp.tile_ids_from_bounds(
+                        bounds, zoom, batch_by=batch_by
+                    )
+                ]
+            )
+
+    with pytest.raises(ValueError):
+        list(TilePyramid("geodetic").tile_ids_from_bounds([0, 0, 90, 90], zoom))
+
+
+def test_tile_ids_from_geom(tile_bounds_polygon):
+    tp = TilePyramid("geodetic")
+    zoom = 3
+    for exact in [False, True]:
+        tiles = [
+            t.id for t in tp.tiles_from_geom(tile_bounds_polygon, zoom, exact=exact)
+        ]
+        assert (
+            list(tp.tile_ids_from_geom(tile_bounds_polygon, zoom, exact=exact)) == tiles
+        )
+        assert [
+            tile_id
+            for batch in tp.tile_ids_from_geom(
+                tile_bounds_polygon, zoom, batch_by="row", exact=exact
+            )
+            for tile_id in batch
+        ] == tiles
+
+
 def test_snap_bounds():
     bounds = (0, 1, 2, 3)
     tp = TilePyramid("geodetic")
@@ -374,3 +451,62 @@ def test_deprecated():
     assert tp.tile_y_size(0)
     assert tp.tile_height(0)
     assert tp.tile_width(0)
+
+
+def test_zoom_params_cache():
+    tp = TilePyramid("geodetic", metatiling=4)
+    other_tp = TilePyramid("geodetic", metatiling=1)
+    # zoom, matrix_width, matrix_height, pixel_x_size, tile_x_size, tile_width
+    expected = [
+        (0, 1, 1, 0.703125, 360.0, 512),
+        (1, 1, 1, 0.3515625, 360.0, 1024),
+        (2, 2, 1, 0.17578125, 180.0, 1024),
+        (3, 4, 2, 0.087890625, 90.0, 1024),
+        (8, 128, 64, 0.00274658203125, 2.8125, 1024),
+    ]
+    other_expected = [
+        (0, 2, 1, 0.703125, 180.0, 256),
+        (1, 4, 2, 0.3515625, 90.0, 256),
+        (2, 8, 4, 0.17578125, 45.0, 256),
+        (3, 16, 8, 0.087890625, 22.5, 256),
+        (8, 512, 256, 0.00274658203125, 0.703125, 256),
+    ]
+    # read values twice, the second time they come from the cache
+    for _ in range(2):
+        for pyramid, values in [(tp, expected), (other_tp, other_expected)]:
+            for zoom, width, height, pixel_x_size, tile_x_size, tile_width in values:
+                assert pyramid.matrix_width(zoom) == width
+                assert pyramid.matrix_height(zoom) == height
+                assert pyramid.pixel_x_size(zoom) == pixel_x_size
+                # tile_x_size() and tile_width() are deprecated
+                assert pyramid._zoom_params(zoom).tile_x_size == tile_x_size
+                assert pyramid._zoom_params(zoom).tile_width == tile_width
+    # cache entries are not shared between pyramids
+    assert tp._zoom_params_cache is not other_tp._zoom_params_cache
+    assert tp._zoom_params(3) != other_tp._zoom_params(3)
+    assert sorted(tp._zoom_params_cache) == [0, 1, 2, 3, 8]
+    # zoom validation is not bypassed by cached values
+    with pytest.raises(TypeError):
+        tp.matrix_width(1.0)
+    with pytest.raises(ValueError):
+        tp.matrix_width(-1)
+
+
+def test_deprecated_warn_once(monkeypatch):
+    monkeypatch.setattr("tilematrix._tilepyramid._DEPRECATION_WARNINGS_ISSUED", set())
+    tp = TilePyramid("geodetic")
+    with pytest.warns(DeprecationWarning):
+        assert tp.type == "geodetic"
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert tp.type == "geodetic"
+
+
+def test_weakref():
+    tp = TilePyramid("geodetic")
+    assert weakref.ref(tp)() is tp
+    cache = weakref.WeakKeyDictionary()
+    cache[tp] = True
+    assert cache[TilePyramid("geodetic")]
+    del tp
+    assert not cache
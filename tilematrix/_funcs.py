@@ -1,6 +1,7 @@
 """Helper functions."""
 
-from itertools import product
+from itertools import islice, product
+import math
 
 from rasterio.crs import CRS
 from shapely.affinity import translate
@@ -8,8 +9,14 @@ from shapely.geometry import Polygon, GeometryCollection, box
 from shapely.ops import unary_union
 from shapely.prepared import prep
 
+try:
+    # vectorized geometry functions are available since Shapely 2.0
+    from shapely import box as _boxes, intersects as _intersects
+except ImportError:  # pragma: no cover
+    _boxes = _intersects = None
+
 from ._conf import DELTA, ROUND
-from ._types import Bounds, Shape
+from ._types import Bounds, Shape, TileIndex
 
 
 def validate_zoom(zoom):
@@ -19,6 +26,11 @@ def validate_zoom(zoom):
         raise ValueError("zoom must be greater or equal 0")
 
 
+def _validate_bounds(bounds):
+    if not isinstance(bounds, tuple) or len(bounds) != 4:
+        raise ValueError("bounds must be a tuple of left, bottom, right, top values")
+
+
 def clip_geometry_to_srs_bounds(geometry, pyramid, multipart=False):
     """
     Clip input geometry to SRS bounds of given TilePyramid.
@@ -33,11 +45,11 @@ def clip_geometry_to_srs_bounds(geometry, pyramid, multipart=False):
     """
     if not geometry.is_valid:
         raise ValueError("invalid geometry given")
-    pyramid_bbox = box(*pyramid.bounds)
 
     # Special case for global tile pyramids if geometry extends over tile
     # pyramid boundaries (such as the antimeridian).
-    if pyramid.is_global and not geometry.within(pyramid_bbox):
+    if pyramid.is_global and not _bounds_within(geometry.bounds, pyramid.bounds):
+        pyramid_bbox = box(*pyramid.bounds)
         inside_geom = geometry.intersection(pyramid_bbox)
         outside_geom = geometry.difference(pyramid_bbox)
         # shift outside geometry so it lies within SRS bounds
@@ -81,6 +93,16 @@ def snap_bounds(bounds=None, tile_pyramid=None, zoom=None, pixelbuffer=0):
     return Bounds(left, bottom, right, top)
 
 
+def _bounds_within(inner, outer):
+    """Return whether inner bounds are within or equal to outer bounds."""
+    return (
+        inner[0] >= outer[0]
+        and inner[1] >= outer[1]
+        and inner[2] <= outer[2]
+        and inner[3] <= outer[3]
+    )
+
+
 def _verify_shape_bounds(shape, bounds):
     """Verify that shape corresponds to bounds apect ratio."""
     if not isinstance(shape, (tuple, list)) or len(shape) != 2:
@@ -127,6 +149,14 @@ def _get_crs(srs):
         raise TypeError("provide either 'wkt', 'epsg' or 'proj' definition")
 
 
+def _ceil_div(a, b):
+    """Return a divided by b rounded up to the next integer."""
+    if isinstance(a, int) and isinstance(b, int):
+        # stay in integer arithmetic
+        return -(-a // b)
+    return int(math.ceil(a / b))
+
+
 def _tile_intersecting_tilepyramid(tile, tp):
     """Return all tiles from tilepyramid intersecting with tile."""
     if tile.tp.grid != tp.grid:
@@ -153,13 +183,13 @@ def _tile_intersecting_tilepyramid(tile, tp):
         return [tp.tile(*tile.id)]
 
 
-def _global_tiles_from_bounds(tp, bounds, zoom, batch_by=None):
-    """Return also Tiles if bounds cross the antimeridian."""
+def _global_tile_ids_from_bounds(tp, bounds, zoom, batch_by=None):
+    """Return also tile indexes if bounds cross the antimeridian."""
 
     # clip to tilepyramid top and bottom bounds
-    left, right = bounds.left, bounds.right
-    top = min([tp.top, bounds.top])
-    bottom = max([tp.bottom, bounds.bottom])
+    left, bottom, right, top = bounds
+    top = min(tp.top, top)
+    bottom = max(tp.bottom, bottom)
 
     # special case if bounds cross the antimeridian
     if left < tp.left or right > tp.right:
@@ -189,73 +219,227 @@ def _global_tiles_from_bounds(tp, bounds, zoom, batch_by=None):
         # if union of bounding boxes is a multipart geometry, do some costly checks to be able
         # to yield in batches
         if bounds_geom.geom_type.lower().startswith("multi"):
-            if batch_by:
-                for batch in _tiles_from_cleaned_bounds(
-                    tp, bounds_geom.bounds, zoom, batch_by
-                ):
-                    yield (
-                        tile
-                        for tile in batch
-                        if bounds_geom_prep.intersects(tile.bbox())
-                    )
+            row_range, col_range = _tile_ranges_from_cleaned_bounds(
+                tp, bounds_geom.bounds, zoom
+            )
+            # all parts cover the same rows, so the tiles of one row are enough to
+            # determine the intersecting columns
+            tile = tp.tile
+            intersecting_cols = [
+                t.col
+                for t in _tiles_intersecting_geometry(
+                    (tile(zoom, row_range[0], col) for col in col_range),
+                    bounds_geom_prep,
+                )
+            ]
+            if batch_by == "column":
+                # columns between the parts are yielded as empty batches
+                intersecting_cols = set(intersecting_cols)
+                for col in col_range:
+                    rows = row_range if col in intersecting_cols else ()
+                    yield product((zoom,), rows, (col,))
             else:
-                for tile in _tiles_from_cleaned_bounds(tp, bounds_geom.bounds, zoom):
-                    if bounds_geom_prep.intersects(tile.bbox()):
-                        yield tile
+                yield from _tile_ids_from_ranges(
+                    zoom, row_range, intersecting_cols, batch_by=batch_by
+                )
             return
 
         # else, continue with cleaned bounds
         bounds = bounds_geom.bounds
 
     # yield using cleaned bounds
-    yield from _tiles_from_cleaned_bounds(tp, bounds, zoom, batch_by=batch_by)
+    yield from _tile_ids_from_cleaned_bounds(tp, bounds, zoom, batch_by=batch_by)
 
 
-def _tiles_from_cleaned_bounds(tp, bounds, zoom, batch_by=None):
-    """Return all tiles intersecting with bounds."""
-    bounds = Bounds(*bounds)
-    lb = _tile_from_xy(tp, bounds.left, bounds.bottom, zoom, on_edge_use="rt")
-    rt = _tile_from_xy(tp, bounds.right, bounds.top, zoom, on_edge_use="lb")
-    row_range = range(rt.row, lb.row + 1)
-    col_range = range(lb.col, rt.col + 1)
+def _tile_ids_from_cleaned_bounds(tp, bounds, zoom, batch_by=None):
+    """Return (zoom, row, col) tuples of all tiles intersecting with bounds."""
+    row_range, col_range = _tile_ranges_from_cleaned_bounds(tp, bounds, zoom)
+    yield from _tile_ids_from_ranges(zoom, row_range, col_range, batch_by=batch_by)
+
+
+def _tile_ranges_from_cleaned_bounds(tp, bounds, zoom):
+    """Return row and column ranges of all tiles intersecting with bounds."""
+    left, bottom, right, top = bounds
+    lb = _tile_from_xy(tp, left, bottom, zoom, on_edge_use="rt")
+    rt = _tile_from_xy(tp, right, top, zoom, on_edge_use="lb")
+    return range(rt.row, lb.row + 1), range(lb.col, rt.col + 1)
+
+
+def _tile_ids_from_ranges(zoom, row_range, col_range, batch_by=None):
+    """Return (zoom, row, col) tuples of all tiles within row and column ranges."""
     if batch_by is None:
         for row, col in product(row_range, col_range):
-            yield tp.tile(zoom, row, col)
+            yield (zoom, row, col)
+    # batches bind row and column values on creation as they may be consumed
+    # after the next batch was created
     elif batch_by == "row":
         for row in row_range:
-            yield (tp.tile(zoom, row, col) for col in col_range)
+            yield product((zoom,), (row,), col_range)
     elif batch_by == "column":
         for col in col_range:
-            yield (tp.tile(zoom, row, col) for row in row_range)
+            yield product((zoom,), row_range, (col,))
     else:  # pragma: no cover
         raise ValueError("'batch_by' must either be None, 'row' or 'column'.")
 
 
+def _tile_covering_bounds(tp, bounds, zoom):
+    """Return Tile if it is the only Tile intersecting with bounds, else None."""
+    if not _bounds_within(bounds, tp.bounds):
+        return None
+    left, bottom, right, top = bounds
+    # use the same edge handling as _tile_ids_from_cleaned_bounds()
+    lb = _tile_from_xy(tp, left, bottom, zoom, on_edge_use="rt")
+    rt = _tile_from_xy(tp, right, top, zoom, on_edge_use="lb")
+    if lb.id != rt.id:
+        return None
+    tile_bounds = lb.bounds()
+    if (
+        tile_bounds.left <= left
+        and tile_bounds.bottom <= bottom
+        and tile_bounds.right >= right
+        and tile_bounds.top >= top
+    ):
+        return lb
+    return None
+
+
+def _tiles_intersecting_geometry(tiles, prepared_geometry, chunk_size=1024):
+    """
+    Yield tiles whose bounding box intersects with a prepared geometry.
+
+    With Shapely 2 the tile bounding boxes are created and tested in chunks using
+    the vectorized functions.
+    """
+    if _intersects is None:  # pragma: no cover
+        for tile in tiles:
+            if prepared_geometry.intersects(tile.bbox()):
+                yield tile
+        return
+    geometry = prepared_geometry.context
+    tiles = iter(tiles)
+    while True:
+        chunk = list(islice(tiles, chunk_size))
+        if not chunk:
+            return
+        lefts, bottoms, rights, tops = zip(*(tile.bounds() for tile in chunk))
+        intersecting = _intersects(geometry, _boxes(lefts, bottoms, rights, tops))
+        for tile, tile_intersects in zip(chunk, intersecting):
+            if tile_intersects:
+                yield tile
+
+
+def _tile_indexes(tile_ids, batch_by=None):
+    """Yield (zoom, row, col) tuples as TileIndex, also in batches."""
+    make = TileIndex._make
+    if batch_by:
+        for batch in tile_ids:
+            yield (make(tile_id) for tile_id in batch)
+    else:
+        yield from map(make, tile_ids)
+
+
+def _tiles_from_points(tp, points, bounds, zoom):
+    """
+    Return tiles intersecting with points, ordered by row and column.
+
+    Points must be within the TilePyramid bounds. Tiles touching a point on their
+    edges are included but only within the tile range covering the points bounds,
+    just like when testing each Tile from _tile_ids_from_cleaned_bounds().
+    """
+    lb = _tile_from_xy(tp, bounds[0], bounds[1], zoom, on_edge_use="rt")
+    rt = _tile_from_xy(tp, bounds[2], bounds[3], zoom, on_edge_use="lb")
+    row_range = range(rt.row, lb.row + 1)
+    col_range = range(lb.col, rt.col + 1)
+    zoom_params = tp._zoom_params(zoom)
+    left, top = tp.left, tp.top
+    tile_x_size = zoom_params.metatile_x_size
+    tile_y_size = zoom_params.metatile_y_size
+    matrix_width = zoom_params.matrix_width
+    candidates = {}
+    tiles = {}
+    for x, y in points:
+        # no antimeridian wrapping as points are within TilePyramid bounds
+        row, col = _tile_index_from_xy(
+            x, y, left, top, tile_x_size, tile_y_size, matrix_width, False, False, False
+        )
+        # points on or very close to a tile edge can also touch neighbor tiles
+        for index in product((row - 1, row, row + 1), (col - 1, col, col + 1)):
+            if index in tiles or index[0] not in row_range or index[1] not in col_range:
+                continue
+            try:
+                tile, (t_left, t_bottom, t_right, t_top) = candidates[index]
+            except KeyError:
+                tile = tp.tile(zoom, *index)
+                candidates[index] = (tile, tile.bounds())
+                t_left, t_bottom, t_right, t_top = candidates[index][1]
+            if t_left <= x <= t_right and t_bottom <= y <= t_top:
+                tiles[index] = tile
+    return [tiles[index] for index in sorted(tiles)]
+
+
 def _tile_from_xy(tp, x, y, zoom, on_edge_use="rb"):
+    zoom_params = tp._zoom_params(zoom)
+    use_top, use_left = _ON_EDGE_USE[on_edge_use]
+    row, col = _tile_index_from_xy(
+        x,
+        y,
+        tp.left,
+        tp.top,
+        zoom_params.metatile_x_size,
+        zoom_params.metatile_y_size,
+        zoom_params.matrix_width,
+        tp.is_global,
+        use_top,
+        use_left,
+    )
+    try:
+        return tp.tile(zoom, row, col)
+    except ValueError as e:
+        raise ValueError(
+            "on_edge_use '%s' results in an invalid tile: %s" % (on_edge_use, e)
+        )
+
+
+# on_edge_use values mapped to whether the top row and the left column should be
+# used if a point hits a grid edge
+_ON_EDGE_USE = {
+    "rb": (False, False),
+    "rt": (True, False),
+    "lt": (True, True),
+    "lb": (False, True),
+}
+
+
+def _tile_index_from_xy(
+    x,
+    y,
+    left,
+    top,
+    tile_x_size,
+    tile_y_size,
+    matrix_width,
+    is_global,
+    use_top,
+    use_left,
+):
+    """Return row and column of tile covering x and y."""
     # determine row
-    tile_y_size = round(tp.pixel_y_size(zoom) * tp.tile_size * tp.metatiling, ROUND)
-    row = int((tp.top - y) / tile_y_size)
-    if on_edge_use in ["rt", "lt"] and (tp.top - y) % tile_y_size == 0.0:
+    row = int((top - y) / tile_y_size)
+    if use_top and (top - y) % tile_y_size == 0.0:
         row -= 1
 
     # determine column
-    tile_x_size = round(tp.pixel_x_size(zoom) * tp.tile_size * tp.metatiling, ROUND)
-    col = int((x - tp.left) / tile_x_size)
-    if on_edge_use in ["lb", "lt"] and (x - tp.left) % tile_x_size == 0.0:
+    col = int((x - left) / tile_x_size)
+    if use_left and (x - left) % tile_x_size == 0.0:
         col -= 1
 
     # handle Antimeridian wrapping
-    if tp.is_global:
+    if is_global:
         # left side
         if col == -1:
-            col = tp.matrix_width(zoom) - 1
+            col = matrix_width - 1
         # right side
-        elif col >= tp.matrix_width(zoom):
-            col = col % tp.matrix_width(zoom)
+        elif col >= matrix_width:
+            col = col % matrix_width
 
-    try:
-        return tp.tile(zoom, row, col)
-    except ValueError as e:
-        raise ValueError(
-            "on_edge_use '%s' results in an invalid tile: %s" % (on_edge_use, e)
-        )
+    return row, col
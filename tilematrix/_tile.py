@@ -30,8 +30,10 @@ class Tile(object):
         self.col = col
         self.is_valid()
         self.index = self.id = TileIndex(zoom, row, col)
-        self.pixel_x_size = self.tile_pyramid.pixel_x_size(self.zoom)
-        self.pixel_y_size = self.tile_pyramid.pixel_y_size(self.zoom)
+        # zoom was already validated by is_valid()
+        zoom_params = self.tile_pyramid._zoom_params(self.zoom)
+        self.pixel_x_size = zoom_params.pixel_x_size
+        self.pixel_y_size = zoom_params.pixel_y_size
         # base SRID size without pixelbuffer
         self._base_srid_size = Shape(
             height=self.pixel_y_size * self.tp.tile_size * self.tp.metatiling,
@@ -50,6 +52,9 @@ class Tile(object):
             height=int(round((self._top - self._bottom) / self.pixel_y_size, 0)),
             width=int(round((self._right - self._left) / self.pixel_x_size, 0)),
         )
+        # bounds and bounding box without pixelbuffer are cached on first use
+        self._bounds = None
+        self._bbox = None
 
     @property
     def left(self):
@@ -98,6 +103,13 @@ class Tile(object):
 
         - pixelbuffer: tile buffer in pixels
         """
+        if not pixelbuffer:
+            if self._bounds is None:
+                self._bounds = self._calculate_bounds()
+            return self._bounds
+        return self._calculate_bounds(pixelbuffer)
+
+    def _calculate_bounds(self, pixelbuffer=0):
         left = self._left
         bottom = self._bottom
         right = self._right
@@ -120,6 +132,10 @@ class Tile(object):
 
         - pixelbuffer: tile buffer in pixels
         """
+        if not pixelbuffer:
+            if self._bbox is None:
+                self._bbox = box(*self.bounds())
+            return self._bbox
         return box(*self.bounds(pixelbuffer=pixelbuffer))
 
     def affine(self, pixelbuffer=0):
@@ -148,7 +164,7 @@ class Tile(object):
         width = self._base_shape.width + 2 * pixelbuffer
         if pixelbuffer and self.tp.grid.is_global:
             # on first and last row, remove pixelbuffer on top or bottom
-            matrix_height = self.tile_pyramid.matrix_height(self.zoom)
+            matrix_height = self.tile_pyramid._zoom_params(self.zoom).matrix_height
             if matrix_height == 1:
                 height = self._base_shape.height
             elif self.row in [0, matrix_height - 1]:
@@ -168,8 +184,9 @@ class Tile(object):
             ]
         ):
             raise TypeError("zoom, col and row must be integers >= 0")
-        cols = self.tile_pyramid.matrix_width(self.zoom)
-        rows = self.tile_pyramid.matrix_height(self.zoom)
+        zoom_params = self.tile_pyramid._zoom_params(self.zoom)
+        cols = zoom_params.matrix_width
+        rows = zoom_params.matrix_height
         if self.col >= cols:
             raise ValueError("col (%s) exceeds matrix width (%s)" % (self.col, cols))
         if self.row >= rows:
@@ -187,6 +204,7 @@ class Tile(object):
     def get_children(self):
         """Return tiles from next zoom level."""
         next_zoom = self.zoom + 1
+        zoom_params = self.tp._zoom_params(next_zoom)
         return [
             self.tile_pyramid.tile(
                 next_zoom, self.row * 2 + row_offset, self.col * 2 + col_offset
@@ -199,8 +217,8 @@ class Tile(object):
             ]
             if all(
                 [
-                    self.row * 2 + row_offset < self.tp.matrix_height(next_zoom),
-                    self.col * 2 + col_offset < self.tp.matrix_width(next_zoom),
+                    self.row * 2 + row_offset < zoom_params.matrix_height,
+                    self.col * 2 + col_offset < zoom_params.matrix_width,
                 ]
             )
         ]
@@ -245,21 +263,24 @@ class Tile(object):
                 ]
             )
 
+        zoom_params = self.tp._zoom_params(self.zoom)
+        matrix_height = zoom_params.matrix_height
+        matrix_width = zoom_params.matrix_width
         for row_offset, col_offset in matrix_offsets:
             new_row = self.row + row_offset
             new_col = self.col + col_offset
             # omit if row is outside of tile matrix
-            if new_row < 0 or new_row >= self.tp.matrix_height(self.zoom):
+            if new_row < 0 or new_row >= matrix_height:
                 continue
             # wrap around antimeridian if new column is outside of tile matrix
             if new_col < 0:
                 if not self.tp.is_global:
                     continue
-                new_col = self.tp.matrix_width(self.zoom) + new_col
-            elif new_col >= self.tp.matrix_width(self.zoom):
+                new_col = matrix_width + new_col
+            elif new_col >= matrix_width:
                 if not self.tp.is_global:
                     continue
-                new_col -= self.tp.matrix_width(self.zoom)
+                new_col -= matrix_width
             # omit if new tile is current tile
             if new_row == self.row and new_col == self.col:
                 continue
@@ -1,7 +1,9 @@
 """Handling tile pyramids."""
 
+from collections import namedtuple
+from functools import lru_cache
+from itertools import starmap
 from shapely.prepared import prep
-import math
 import warnings
 
 from ._conf import ROUND
@@ -9,13 +11,69 @@ from ._grid import GridDefinition
 from ._tile import Tile
 from ._funcs import (
     validate_zoom,
+    _validate_bounds,
+    _bounds_within,
+    _ceil_div,
     clip_geometry_to_srs_bounds,
     _tile_intersecting_tilepyramid,
-    _global_tiles_from_bounds,
-    _tiles_from_cleaned_bounds,
+    _global_tile_ids_from_bounds,
+    _tile_ids_from_cleaned_bounds,
+    _tile_indexes,
+    _tile_covering_bounds,
     _tile_from_xy,
+    _tiles_from_points,
+    _tiles_intersecting_geometry,
+    _ON_EDGE_USE,
 )
-from ._types import Bounds
+
+# zoom dependent matrix and tile parameters
+_ZoomParams = namedtuple(
+    "_ZoomParams",
+    "matrix_width matrix_height tile_x_size tile_y_size tile_width tile_height "
+    "pixel_x_size pixel_y_size metatile_x_size metatile_y_size",
+)
+
+# deprecation warnings which were already issued
+_DEPRECATION_WARNINGS_ISSUED = set()
+
+
+def _warn_deprecated_once(message):
+    """Issue a DeprecationWarning only on first use of a deprecated attribute."""
+    if message not in _DEPRECATION_WARNINGS_ISSUED:
+        _DEPRECATION_WARNINGS_ISSUED.add(message)
+        # point to the code accessing the deprecated attribute
+        warnings.warn(DeprecationWarning(message), stacklevel=3)
+
+
+def _freeze(value):
+    """
+    Return value as hashable tuple usable as cache key.
+
+    Values are stored together with their type, as e.g. int and float bounds
+    compare equal but result in a different GridDefinition representation.
+    """
+    if isinstance(value, dict):
+        return (dict, tuple(sorted((key, _freeze(v)) for key, v in value.items())))
+    # e.g. bounds and shape become lists when dumped to and loaded from JSON
+    if isinstance(value, (list, tuple)):
+        return (tuple, tuple(_freeze(v) for v in value))
+    return (type(value), value)
+
+
+def _thaw(frozen):
+    """Return value from tuple created by _freeze()."""
+    value_type, value = frozen
+    if value_type is dict:
+        return {key: _thaw(v) for key, v in value}
+    if value_type is tuple:
+        return tuple(_thaw(v) for v in value)
+    return value
+
+
+@lru_cache(maxsize=128)
+def _cached_grid_definition(grid_items):
+    """Return GridDefinition and reuse it for equal grid definition dictionaries."""
+    return GridDefinition(_thaw(grid_items))
 
 
 class TilePyramid(object):
@@ -33,6 +91,27 @@ class TilePyramid(object):
         16.
     """
 
+    __slots__ = (
+        "grid",
+        "bounds",
+        "left",
+        "bottom",
+        "right",
+        "top",
+        "crs",
+        "is_global",
+        "metatiling",
+        "tile_size",
+        "metatile_size",
+        "x_size",
+        "y_size",
+        "_zoom_params_cache",
+        "_repr",
+        "_hash",
+        # keep TilePyramid usable in weak references
+        "__weakref__",
+    )
+
     def __init__(self, grid=None, tile_size=256, metatiling=1):
         """Initialize TilePyramid."""
         if grid is None:
@@ -41,7 +120,9 @@ class TilePyramid(object):
         if metatiling not in _metatiling_opts:
             raise ValueError(f"metatling must be one of {_metatiling_opts}")
         # get source grid parameters
-        self.grid = GridDefinition(grid)
+        # GridDefinition objects are not altered after initialization and can be
+        # shared
+        self.grid = grid if isinstance(grid, GridDefinition) else GridDefinition(grid)
         self.bounds = self.grid.bounds
         self.left, self.bottom, self.right, self.top = self.bounds
         self.crs = self.grid.crs
@@ -53,16 +134,24 @@ class TilePyramid(object):
         # size in map units
         self.x_size = float(round(self.right - self.left, ROUND))
         self.y_size = float(round(self.top - self.bottom, ROUND))
+        # zoom dependent parameters are calculated once per zoom level on first
+        # access; calculating them eagerly for all zoom levels would make
+        # initialization of a TilePyramid many times slower
+        self._zoom_params_cache = {}
+        # representation and hash are calculated on first use
+        self._repr = None
+        self._hash = None
 
     @property
     def type(self):
-        warnings.warn(DeprecationWarning("'type' attribute is deprecated"))
+        _warn_deprecated_once("'type' attribute is deprecated")
         return self.grid.type
 
     @property
     def srid(self):
-        warnings.warn(DeprecationWarning("'srid' attribute is deprecated"))
-        return self.grid.srid
+        _warn_deprecated_once("'srid' attribute is deprecated")
+        # same as the also deprecated GridDefinition.srid
+        return self.grid.crs.to_epsg()
 
     def tile(self, zoom=None, row=None, col=None):
         """
@@ -81,8 +170,7 @@ class TilePyramid(object):
         - zoom: zoom level
         """
         validate_zoom(zoom)
-        width = int(math.ceil(self.grid.shape.width * 2 ** (zoom) / self.metatiling))
-        return 1 if width < 1 else width
+        return self._zoom_params(zoom).matrix_width
 
     def matrix_height(self, zoom):
         """
@@ -91,8 +179,7 @@ class TilePyramid(object):
         - zoom: zoom level
         """
         validate_zoom(zoom)
-        height = int(math.ceil(self.grid.shape.height * 2 ** (zoom) / self.metatiling))
-        return 1 if height < 1 else height
+        return self._zoom_params(zoom).matrix_height
 
     def tile_x_size(self, zoom):
         """
@@ -102,7 +189,7 @@ class TilePyramid(object):
         """
         warnings.warn(DeprecationWarning("tile_x_size is deprecated"))
         validate_zoom(zoom)
-        return round(self.x_size / self.matrix_width(zoom), ROUND)
+        return self._zoom_params(zoom).tile_x_size
 
     def tile_y_size(self, zoom):
         """
@@ -112,7 +199,7 @@ class TilePyramid(object):
         """
         warnings.warn(DeprecationWarning("tile_y_size is deprecated"))
         validate_zoom(zoom)
-        return round(self.y_size / self.matrix_height(zoom), ROUND)
+        return self._zoom_params(zoom).tile_y_size
 
     def tile_width(self, zoom):
         """
@@ -122,9 +209,7 @@ class TilePyramid(object):
         """
         warnings.warn(DeprecationWarning("tile_width is deprecated"))
         validate_zoom(zoom)
-        matrix_pixel = 2 ** (zoom) * self.tile_size * self.grid.shape.width
-        tile_pixel = self.tile_size * self.metatiling
-        return matrix_pixel if tile_pixel > matrix_pixel else tile_pixel
+        return self._zoom_params(zoom).tile_width
 
     def tile_height(self, zoom):
         """
@@ -134,9 +219,7 @@ class TilePyramid(object):
         """
         warnings.warn(DeprecationWarning("tile_height is deprecated"))
         validate_zoom(zoom)
-        matrix_pixel = 2 ** (zoom) * self.tile_size * self.grid.shape.height
-        tile_pixel = self.tile_size * self.metatiling
-        return matrix_pixel if tile_pixel > matrix_pixel else tile_pixel
+        return self._zoom_params(zoom).tile_height
 
     def pixel_x_size(self, zoom):
         """
@@ -145,11 +228,7 @@ class TilePyramid(object):
         - zoom: zoom level
         """
         validate_zoom(zoom)
-        return round(
-            (self.grid.right - self.grid.left)
-            / (self.grid.shape.width * 2**zoom * self.tile_size),
-            ROUND,
-        )
+        return self._zoom_params(zoom).pixel_x_size
 
     def pixel_y_size(self, zoom):
         """
@@ -158,11 +237,57 @@ class TilePyramid(object):
         - zoom: zoom level
         """
         validate_zoom(zoom)
-        return round(
+        return self._zoom_params(zoom).pixel_y_size
+
+    def _zoom_params(self, zoom):
+        """Return cached zoom dependent parameters, calculate them if not available."""
+        try:
+            return self._zoom_params_cache[zoom]
+        except KeyError:
+            params = self._zoom_params_cache[zoom] = self._calculate_zoom_params(zoom)
+            return params
+
+    def _calculate_zoom_params(self, zoom):
+        # number of zoom level 0 tiles fitting into one row or column at zoom
+        zoom_factor = 1 << zoom
+        width = _ceil_div(self.grid.shape.width * zoom_factor, self.metatiling)
+        matrix_width = 1 if width < 1 else width
+        height = _ceil_div(self.grid.shape.height * zoom_factor, self.metatiling)
+        matrix_height = 1 if height < 1 else height
+        tile_pixel = self.tile_size * self.metatiling
+        matrix_pixel_width = zoom_factor * self.tile_size * self.grid.shape.width
+        matrix_pixel_height = zoom_factor * self.tile_size * self.grid.shape.height
+        pixel_x_size = round(
+            (self.grid.right - self.grid.left)
+            / (self.grid.shape.width * zoom_factor * self.tile_size),
+            ROUND,
+        )
+        pixel_y_size = round(
             (self.grid.top - self.grid.bottom)
-            / (self.grid.shape.height * 2**zoom * self.tile_size),
+            / (self.grid.shape.height * zoom_factor * self.tile_size),
             ROUND,
         )
+        return _ZoomParams(
+            matrix_width=matrix_width,
+            matrix_height=matrix_height,
+            tile_x_size=round(self.x_size / matrix_width, ROUND),
+            tile_y_size=round(self.y_size / matrix_height, ROUND),
+            tile_width=(
+                matrix_pixel_width if tile_pixel > matrix_pixel_width else tile_pixel
+            ),
+            tile_height=(
+                matrix_pixel_height if tile_pixel > matrix_pixel_height else tile_pixel
+            ),
+            pixel_x_size=pixel_x_size,
+            pixel_y_size=pixel_y_size,
+            # (meta)tile size in SRID units, not clipped to the tile matrix extent
+            metatile_x_size=round(
+                pixel_x_size * self.tile_size * self.metatiling, ROUND
+            ),
+            metatile_y_size=round(
+                pixel_y_size * self.tile_size * self.metatiling, ROUND
+            ),
+        )
 
     def intersecting(self, tile):
         """
@@ -188,16 +313,46 @@ class TilePyramid(object):
         - batch_by: yield tiles in row or column batches if activated
         """
         validate_zoom(zoom)
-        if not isinstance(bounds, tuple) or len(bounds) != 4:
-            raise ValueError(
-                "bounds must be a tuple of left, bottom, right, top values"
-            )
-        if not isinstance(bounds, Bounds):
-            bounds = Bounds(*bounds)
+        _validate_bounds(bounds)
+        yield from self._tiles_from_bounds(bounds, zoom, batch_by=batch_by)
+
+    def tile_ids_from_bounds(self, bounds=None, zoom=None, batch_by=None):
+        """
+        Return indexes of all tiles intersecting with bounds.
+
+        Same as tiles_from_bounds() but yields TileIndex tuples instead of Tile
+        objects.
+
+        - bounds: tuple of (left, bottom, right, top) bounding values in tile
+            pyramid CRS
+        - zoom: zoom level
+        - batch_by: yield tile indexes in row or column batches if activated
+        """
+        validate_zoom(zoom)
+        _validate_bounds(bounds)
+        yield from _tile_indexes(
+            self._tile_ids_from_bounds(bounds, zoom, batch_by=batch_by), batch_by
+        )
+
+    def _tiles_from_bounds(self, bounds, zoom, batch_by=None):
+        """Return all tiles intersecting with already validated bounds and zoom."""
+        tile = self.tile
+        if batch_by:
+            for batch in self._tile_ids_from_bounds(bounds, zoom, batch_by=batch_by):
+                yield (tile(*tile_id) for tile_id in batch)
+        else:
+            yield from starmap(tile, self._tile_ids_from_bounds(bounds, zoom))
+
+    def _tile_ids_from_bounds(self, bounds, zoom, batch_by=None):
+        """Return (zoom, row, col) tuples intersecting with validated bounds and zoom."""
         if self.is_global:
-            yield from _global_tiles_from_bounds(self, bounds, zoom, batch_by=batch_by)
+            yield from _global_tile_ids_from_bounds(
+                self, bounds, zoom, batch_by=batch_by
+            )
         else:
-            yield from _tiles_from_cleaned_bounds(self, bounds, zoom, batch_by=batch_by)
+            yield from _tile_ids_from_cleaned_bounds(
+                self, bounds, zoom, batch_by=batch_by
+            )
 
     def tiles_from_bbox(self, geometry=None, zoom=None, batch_by=None):
         """
@@ -207,7 +362,20 @@ class TilePyramid(object):
         - zoom: zoom level
         """
         validate_zoom(zoom)
-        yield from self.tiles_from_bounds(geometry.bounds, zoom, batch_by=batch_by)
+        yield from self._tiles_from_bounds(geometry.bounds, zoom, batch_by=batch_by)
+
+    def tile_ids_from_bbox(self, geometry=None, zoom=None, batch_by=None):
+        """
+        Indexes of all metatiles intersecting with given bounding box.
+
+        - geometry: shapely geometry
+        - zoom: zoom level
+        """
+        validate_zoom(zoom)
+        yield from _tile_indexes(
+            self._tile_ids_from_bounds(geometry.bounds, zoom, batch_by=batch_by),
+            batch_by,
+        )
 
     def tiles_from_geom(self, geometry=None, zoom=None, batch_by=None, exact=False):
         """
@@ -239,8 +407,8 @@ class TilePyramid(object):
             if exact:
                 geometry = clip_geometry_to_srs_bounds(geometry, self)
                 if batch_by:
-                    for batch in self.tiles_from_bbox(
-                        geometry, zoom, batch_by=batch_by
+                    for batch in self._tiles_from_bounds(
+                        geometry.bounds, zoom, batch_by=batch_by
                     ):
                         yield (
                             tile
@@ -248,24 +416,56 @@ class TilePyramid(object):
                             if geometry.intersection(tile.bbox()).area
                         )
                 else:
-                    for tile in self.tiles_from_bbox(geometry, zoom, batch_by=batch_by):
+                    for tile in self._tiles_from_bounds(geometry.bounds, zoom):
                         if geometry.intersection(tile.bbox()).area:
                             yield tile
             else:
+                bounds = geometry.bounds
+                # if geometry lies within one single tile, no intersection checks
+                # are required
+                tile = _tile_covering_bounds(self, bounds, zoom)
+                if tile is not None:
+                    yield (tile for _ in range(1)) if batch_by else tile
+                    return
+                if (
+                    geometry.geom_type == "MultiPoint"
+                    and not batch_by
+                    and _bounds_within(bounds, self.bounds)
+                ):
+                    yield from _tiles_from_points(
+                        self, ((p.x, p.y) for p in geometry.geoms), bounds, zoom
+                    )
+                    return
                 prepared_geometry = prep(clip_geometry_to_srs_bounds(geometry, self))
                 if batch_by:
-                    for batch in self.tiles_from_bbox(
-                        geometry, zoom, batch_by=batch_by
+                    for batch in self._tiles_from_bounds(
+                        bounds, zoom, batch_by=batch_by
                     ):
-                        yield (
-                            tile
-                            for tile in batch
-                            if prepared_geometry.intersects(tile.bbox())
-                        )
+                        yield _tiles_intersecting_geometry(batch, prepared_geometry)
                 else:
-                    for tile in self.tiles_from_bbox(geometry, zoom, batch_by=batch_by):
-                        if prepared_geometry.intersects(tile.bbox()):
-                            yield tile
+                    yield from _tiles_intersecting_geometry(
+                        self._tiles_from_bounds(bounds, zoom), prepared_geometry
+                    )
+
+    def tile_ids_from_geom(self, geometry=None, zoom=None, batch_by=None, exact=False):
+        """
+        Return indexes of all tiles intersecting with input geometry.
+
+        Tiles still have to be created internally to check them against the
+        geometry, so this is mainly a convenience over tiles_from_geom().
+
+        - geometry: shapely geometry
+        - zoom: zoom level
+        """
+        tiles = self.tiles_from_geom(
+            geometry=geometry, zoom=zoom, batch_by=batch_by, exact=exact
+        )
+        if batch_by:
+            for batch in tiles:
+                yield (tile.id for tile in batch)
+        else:
+            for tile in tiles:
+                yield tile.id
 
     def tile_from_xy(self, x=None, y=None, zoom=None, on_edge_use="rb"):
         """
@@ -281,9 +481,10 @@ class TilePyramid(object):
             - lb: left bottom
         """
         validate_zoom(zoom)
-        if x < self.left or x > self.right or y < self.bottom or y > self.top:
+        left, bottom, right, top = self.bounds
+        if x < left or x > right or y < bottom or y > top:
             raise ValueError("x or y are outside of grid bounds")
-        if on_edge_use not in ["lb", "rb", "rt", "lt"]:
+        if on_edge_use not in _ON_EDGE_USE:
             raise ValueError("on_edge_use must be one of lb, rb, rt or lt")
         return _tile_from_xy(self, x, y, zoom, on_edge_use=on_edge_use)
 
@@ -297,11 +498,25 @@ class TilePyramid(object):
             tile_size=self.tile_size,
         )
 
-    def from_dict(config_dict):
+    @classmethod
+    def from_dict(cls, config_dict):
         """
         Initialize TilePyramid from configuration dictionary.
         """
-        return TilePyramid(**config_dict)
+        config = dict(config_dict)
+        grid = config.get("grid")
+        if isinstance(grid, dict):
+            # GridDefinition alters grid dictionaries using the deprecated "type" key
+            config["grid"] = dict(grid)
+            grid_items = _freeze(grid)
+            try:
+                hash(grid_items)
+            except TypeError:
+                # unhashable grid parameters cannot be cached
+                pass
+            else:
+                config["grid"] = _cached_grid_definition(grid_items)
+        return cls(**config)
 
     def __eq__(self, other):
         return (
@@ -315,11 +530,30 @@ class TilePyramid(object):
         return not self.__eq__(other)
 
     def __repr__(self):
-        return "TilePyramid(%s, tile_size=%s, metatiling=%s)" % (
-            self.grid,
-            self.tile_size,
-            self.metatiling,
-        )
+        if self._repr is None:
+            self._repr = "TilePyramid(%s, tile_size=%s, metatiling=%s)" % (
+                self.grid,
+                self.tile_size,
+                self.metatiling,
+            )
+        return self._repr
 
     def __hash__(self):
-        return hash(repr(self) + repr(self.grid))
+        if self._hash is None:
+            self._hash = hash((self.grid, self.tile_size, self.metatiling))
+        return self._hash
+
+    def __getstate__(self):
+        state = {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if name != "__weakref__"
+        }
+        # string hashes differ between interpreter sessions, so the cached hash
+        # must not be restored
+        state["_hash"] = None
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
@@ -124,18 +124,20 @@ def tile(ctx, point, zoom):
 @click.pass_context
 def tiles(ctx, bounds, zoom):
     """Print Tiles from bounds."""
-    tiles = TilePyramid(
+    tp = TilePyramid(
         ctx.obj["grid"],
         tile_size=ctx.obj["tile_size"],
         metatiling=ctx.obj["metatiling"],
-    ).tiles_from_bounds(bounds, zoom=zoom)
+    )
     if ctx.obj["output_format"] == "Tile":
-        for tile in tiles:
-            click.echo("%s %s %s" % tile.id)
+        # only tile indexes are required, no need to create Tile objects
+        for tile_id in tp.tile_ids_from_bounds(bounds, zoom=zoom):
+            click.echo("%s %s %s" % tile_id)
     elif ctx.obj["output_format"] == "WKT":
-        for tile in tiles:
+        for tile in tp.tiles_from_bounds(bounds, zoom=zoom):
             click.echo(tile.bbox(pixelbuffer=ctx.obj["pixelbuffer"]))
     elif ctx.obj["output_format"] == "GeoJSON":
+        tiles = tp.tiles_from_bounds(bounds, zoom=zoom)
         click.echo("{\n" '  "type": "FeatureCollection",\n' '  "features": [')
         # print tiles as they come and only add comma if there is a next tile
         try: